@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Merge per-shard JUnit XML and timing JSON outputs into a single report."""
+
+import argparse
+import os
+import sys
+import xml.etree.ElementTree as ET
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests"))
+
+from helpers.perf import Timings, load_timings, save_timings  # noqa: E402
+
+COUNT_ATTRS = ("tests", "failures", "errors", "skipped")
+
+
+def merge_junit(paths: list[str]) -> tuple[ET.ElementTree, list[tuple[str, float]]]:
+    """
+    Combine the test suites of several JUnit files into one suite.
+
+    Returns the merged tree and the wall time reported by each input file.
+    """
+    merged = ET.Element("testsuite", name="pytest")
+    totals = {attr: 0 for attr in COUNT_ATTRS}
+    total_time = 0.0
+    timestamps = []
+    shard_times = []
+
+    for path in paths:
+        root = ET.parse(path).getroot()
+        suites = [root] if root.tag == "testsuite" else root.findall("testsuite")
+        shard_time = 0.0
+        for suite in suites:
+            for attr in COUNT_ATTRS:
+                totals[attr] += int(suite.get(attr, 0))
+            shard_time += float(suite.get("time", 0))
+            if suite.get("timestamp"):
+                timestamps.append(suite.get("timestamp"))
+            for case in suite.findall("testcase"):
+                merged.append(case)
+        total_time += shard_time
+        shard_times.append((path, shard_time))
+
+    for attr, value in totals.items():
+        merged.set(attr, str(value))
+    merged.set("time", f"{total_time:.3f}")
+    if timestamps:
+        merged.set("timestamp", min(timestamps))
+
+    root = ET.Element("testsuites")
+    root.append(merged)
+    return ET.ElementTree(root), shard_times
+
+
+def merge_timings(paths: list[str]) -> Timings:
+    """Combine the samples of several timing files."""
+    merged = Timings()
+    for path in paths:
+        merged.merge(load_timings(path))
+    return merged
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("inputs", nargs="+", help="Per-shard JUnit (.xml) and timing (.json) files")
+    parser.add_argument("--junit-out", help="Path for the merged JUnit XML")
+    parser.add_argument("--timings-out", help="Path for the merged timing JSON")
+    args = parser.parse_args()
+    if not args.junit_out and not args.timings_out:
+        parser.error("nothing to do, pass --junit-out and/or --timings-out")
+
+    junit_paths = sorted(p for p in args.inputs if p.endswith(".xml"))
+    timing_paths = sorted(p for p in args.inputs if p.endswith(".json"))
+
+    if args.junit_out:
+        if not junit_paths:
+            parser.error("--junit-out given but no .xml inputs")
+        tree, shard_times = merge_junit(junit_paths)
+        ET.indent(tree)
+        tree.write(args.junit_out, encoding="utf-8", xml_declaration=True)
+
+        suite = tree.getroot().find("testsuite")
+        print(f"Merged {len(junit_paths)} JUnit files into {args.junit_out}: "
+              f"{suite.get('tests')} tests, {suite.get('failures')} failures, "
+              f"{suite.get('errors')} errors, {suite.get('skipped')} skipped")
+        for path, seconds in shard_times:
+            print(f"  {path}: {seconds:.1f}s")
+        if shard_times:
+            print(f"  wall time (slowest shard): {max(s for _, s in shard_times):.1f}s")
+
+    if args.timings_out:
+        if not timing_paths:
+            parser.error("--timings-out given but no .json inputs")
+        save_timings(merge_timings(timing_paths), args.timings_out, append=False)
+        print(f"Merged {len(timing_paths)} timing files into {args.timings_out}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
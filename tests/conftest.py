@@ -7,6 +7,8 @@ from datetime import datetime
 from dotenv import load_dotenv
 
 from helpers.sdk_runner import get_runners, get_available_sdks, SDK, SDKRunner
+from helpers import perf, shard
+from helpers.soak import parse_duration
 
 # Load environment variables from .env file
 load_dotenv()
@@ -14,6 +16,9 @@ load_dotenv()
 # Directory for saving inbox exports
 EXPORTS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "exports")
 
+# Directory for saving soak reports
+SOAK_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "soak")
+
 # Reference SDK for smoke tests (must be first in available SDKs priority)
 REFERENCE_SDK = "go"
 
@@ -33,6 +38,96 @@ def pytest_addoption(parser):
         choices=["smoke", "standard", "full"],
         help="Test level: smoke (quick), standard (default), full (all permutations)",
     )
+    parser.addoption(
+        "--perf-record",
+        action="store",
+        default=None,
+        metavar="PATH",
+        help="Append this run's testhelper timings to a JSON file (creates it if missing)",
+    )
+    parser.addoption(
+        "--perf-baseline",
+        action="store",
+        default=None,
+        metavar="PATH",
+        help="Compare timings against a baseline JSON file; fail the run on p95 regressions",
+    )
+    parser.addoption(
+        "--perf-threshold",
+        action="store",
+        type=float,
+        default=10.0,
+        metavar="PCT",
+        help="Allowed p95 slowdown in percent before --perf-baseline reports a regression (default: 10)",
+    )
+    parser.addoption(
+        "--shard",
+        action="store",
+        default=None,
+        metavar="I/N",
+        help="Run only shard I of N (1-based), balanced by estimated test cost",
+    )
+    parser.addoption(
+        "--shard-timings",
+        action="store",
+        default=None,
+        metavar="PATH",
+        help="Timing JSON used to estimate test costs for --shard (default: --perf-baseline)",
+    )
+    parser.addoption(
+        "--soak",
+        action="store",
+        default=None,
+        metavar="DURATION",
+        help="Run the soak test for DURATION per SDK (e.g. 30m, 4h); skipped when not set",
+    )
+    parser.addoption(
+        "--soak-interval",
+        action="store",
+        type=float,
+        default=0.0,
+        metavar="SECONDS",
+        help="Pause between soak cycles in seconds (default: 0)",
+    )
+    parser.addoption(
+        "--mime-corpus",
+        action="store",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Deliver N generated MIME messages and diff read-emails across all SDKs; skipped when 0",
+    )
+    parser.addoption(
+        "--mime-seed",
+        action="store",
+        type=int,
+        default=0,
+        metavar="SEED",
+        help="Seed for the generated MIME corpus (default: 0)",
+    )
+
+
+def pytest_configure(config):
+    """
+    Load the --perf-baseline file before any test runs.
+
+    A missing file is treated as an empty baseline so that the first run can
+    record into the same file it compares against; a malformed file is a
+    usage error rather than a traceback after the whole run.
+    """
+    config._perf_baseline = None
+    config._perf_baseline_missing = False
+    baseline_path = config.getoption("--perf-baseline")
+    if not baseline_path:
+        return
+    if not os.path.exists(baseline_path):
+        config._perf_baseline = perf.Timings()
+        config._perf_baseline_missing = True
+        return
+    try:
+        config._perf_baseline = perf.load_timings(baseline_path)
+    except (OSError, ValueError) as e:
+        raise pytest.UsageError(f"Cannot load --perf-baseline {baseline_path}: {e}")
 
 
 @pytest.fixture(scope="session")
@@ -47,6 +142,36 @@ def test_level(request) -> str:
     return request.config.getoption("--level")
 
 
+@pytest.fixture(scope="session")
+def soak_duration(request) -> float:
+    """Soak duration per SDK in seconds (0 when soak mode is off)."""
+    value = request.config.getoption("--soak")
+    if not value:
+        return 0.0
+    try:
+        return parse_duration(value)
+    except ValueError as e:
+        raise pytest.UsageError(str(e))
+
+
+@pytest.fixture(scope="session")
+def soak_interval(request) -> float:
+    """Pause between soak cycles in seconds."""
+    return request.config.getoption("--soak-interval")
+
+
+@pytest.fixture(scope="session")
+def mime_corpus_size(request) -> int:
+    """Number of generated MIME messages for the differential decode test."""
+    return request.config.getoption("--mime-corpus")
+
+
+@pytest.fixture(scope="session")
+def mime_seed(request) -> int:
+    """Seed for the generated MIME corpus."""
+    return request.config.getoption("--mime-seed")
+
+
 def save_export(export_data: dict, test_name: str) -> str:
     """Save export data to a JSON file and return the path."""
     os.makedirs(EXPORTS_DIR, exist_ok=True)
@@ -58,6 +183,16 @@ def save_export(export_data: dict, test_name: str) -> str:
     return filepath
 
 
+def save_soak_report(report: dict, test_name: str) -> str:
+    """Save a soak report to a JSON file and return the path."""
+    os.makedirs(SOAK_DIR, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    filepath = os.path.join(SOAK_DIR, f"{test_name}_{timestamp}.json")
+    with open(filepath, "w") as f:
+        json.dump(report, f, indent=2)
+    return filepath
+
+
 @pytest.fixture(scope="session")
 def runners() -> dict[SDK, SDKRunner]:
     """Get all configured SDK runners."""
@@ -177,3 +312,101 @@ def any_sdk(runners) -> SDKRunner:
     if not runners:
         pytest.skip("No SDKs configured")
     return next(iter(runners.values()))
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config, items):
+    """
+    Deselect opt-in tests whose option is off, then keep only this node's shard.
+
+    Runs after pytest's own -k/-m deselection, and opt-in tests are removed
+    before sharding, so shards are balanced over the tests that actually run.
+    All nodes collect the same matrix and compute the same cost-balanced
+    assignment, so every test runs on exactly one shard.
+    """
+    opt_in = {"soak": bool(config.getoption("--soak")), "mime_corpus": bool(config.getoption("--mime-corpus"))}
+    disabled = [
+        item for item in items
+        if any(item.get_closest_marker(marker) and not enabled for marker, enabled in opt_in.items())
+    ]
+    if disabled:
+        config.hook.pytest_deselected(items=disabled)
+        items[:] = [item for item in items if item not in disabled]
+
+    shard_spec = config.getoption("--shard")
+    if not shard_spec:
+        return
+
+    try:
+        index, total = shard.parse_shard(shard_spec)
+    except ValueError as e:
+        raise pytest.UsageError(str(e))
+
+    timings_path = config.getoption("--shard-timings")
+    if timings_path:
+        try:
+            timings = perf.load_timings(timings_path) if os.path.exists(timings_path) else None
+        except (OSError, ValueError) as e:
+            raise pytest.UsageError(f"Cannot load --shard-timings {timings_path}: {e}")
+    else:
+        timings = config._perf_baseline
+    sdk_costs = shard.sdk_costs(timings)
+
+    costs = {
+        item.nodeid: shard.estimate_cost(
+            item.nodeid,
+            getattr(getattr(item, "callspec", None), "params", {}),
+            timings,
+            sdk_costs,
+            tuple(getattr(item, "fixturenames", ())),
+        )
+        for item in items
+    }
+    assignment = shard.assign_shards(costs, total)
+
+    selected = [item for item in items if assignment[item.nodeid] == index]
+    deselected = [item for item in items if assignment[item.nodeid] != index]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+    # With more shards than tests some shards get nothing; that is not a failure
+    config._shard_empty = not selected
+
+
+def pytest_runtest_logreport(report):
+    """Record test durations so later runs can balance shards by cost."""
+    if report.when == "call" and report.passed:
+        perf.record_test_duration(report.nodeid, report.duration)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Save recorded timings and compare them against the baseline, if requested."""
+    config = session.config
+    record_path = config.getoption("--perf-record")
+
+    if getattr(config, "_shard_empty", False) and session.exitstatus == pytest.ExitCode.NO_TESTS_COLLECTED:
+        session.exitstatus = pytest.ExitCode.OK
+    baseline_path = config.getoption("--perf-baseline")
+
+    if baseline_path:
+        threshold = config.getoption("--perf-threshold")
+        comparisons = perf.compare_timings(config._perf_baseline, perf.recorder, threshold)
+        config._perf_report = perf.format_comparison_table(comparisons, threshold)
+        if config._perf_baseline_missing:
+            config._perf_report.insert(0, f"Baseline {baseline_path} not found; comparing against an empty baseline")
+        if any(c.is_regression for c in comparisons) and session.exitstatus == 0:
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+    if record_path and perf.recorder:
+        perf.save_timings(perf.recorder, record_path)
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Print the performance diff table when comparing against a baseline."""
+    report = getattr(config, "_perf_report", None)
+    if report is None:
+        return
+    terminalreporter.section("performance")
+    for line in report:
+        terminalreporter.write_line(line)
@@ -1,2 +1,2 @@
 from .sdk_runner import SDKRunner, get_runners, get_available_sdks, SDK
-from .smtp import send_test_email, send_email_with_attachment, send_html_email
+from .smtp import send_test_email, send_email_with_attachment, send_html_email, send_messages
@@ -0,0 +1,323 @@
+"""MIME corpus - Seeded generator of varied MIME messages for differential decode tests."""
+
+import random
+import re
+from dataclasses import dataclass
+from email import encoders
+from email.header import Header
+from email.message import Message
+from email.mime.base import MIMEBase
+from email.mime.multipart import MIMEMultipart
+from email.mime.nonmultipart import MIMENonMultipart
+from typing import Iterator, Optional
+
+# Charsets paired with sample text each can represent
+CHARSET_TEXTS = [
+    ("us-ascii", "The quick brown fox jumps over the lazy dog."),
+    ("utf-8", "Unicode: 你好世界 🌍 émojis работает ελληνικά"),
+    ("iso-8859-1", "Café crème, naïve façade, señor Müller."),
+    ("iso-8859-15", "Prix: 15€, œuvre, Šárka"),
+    ("windows-1252", "“Smart quotes” – and dashes… €100"),
+    ("koi8-r", "Съешь же ещё этих мягких французских булок"),
+    ("shift_jis", "日本語のテキストです。カタカナ"),
+    ("iso-2022-jp", "こんにちは、世界"),
+    ("gb2312", "简体中文测试邮件"),
+]
+
+# Content-Transfer-Encodings applied to text parts
+TRANSFER_ENCODINGS = ["7bit", "8bit", "quoted-printable", "base64"]
+
+# Maximum line length in octets, excluding CRLF (RFC 5322 section 2.1.1)
+MAX_LINE_OCTETS = 998
+
+ATTACHMENT_TYPES = [
+    ("application/octet-stream", "bin"),
+    ("application/pdf", "pdf"),
+    ("application/json", "json"),
+    ("text/plain", "txt"),
+    ("text/csv", "csv"),
+    ("image/png", "png"),
+    ("image/jpeg", "jpg"),
+]
+
+FILENAME_STEMS = ["report", "data", "résumé", "отчёт", "写真", "file with spaces", "a" * 80]
+
+# Message shapes and their relative weights
+SHAPES = [
+    ("plain", 3),
+    ("html-alternative", 2),
+    ("attachments", 2),
+    ("many-attachments", 1),
+    ("nested", 2),
+    ("inline-related", 1),
+    ("large-headers", 1),
+]
+
+
+@dataclass
+class CorpusMessage:
+    """One generated message and how to reproduce it."""
+
+    index: int
+    seed: int
+    shape: str
+    subject: str
+    message: Message
+
+
+def _text_part(rng: random.Random, subtype: str = "plain", repeat: int = 1) -> Message:
+    """Build a text part in a random charset and transfer encoding."""
+    charset, sample = rng.choice(CHARSET_TEXTS)
+    if subtype == "html":
+        body = "<html><body>\n" + "\n".join(f"<p>{sample}</p>" for _ in range(repeat)) + "\n</body></html>"
+    else:
+        lines = [sample] * repeat
+        # Occasionally add a line longer than the 78 character SMTP recommendation
+        if rng.random() < 0.3:
+            lines.append(" ".join([sample] * 5))
+        body = "\n".join(lines)
+
+    encoding = rng.choice(TRANSFER_ENCODINGS)
+    payload = body.encode(charset)
+    if encoding == "7bit" and any(b > 0x7F for b in payload):
+        # 7bit can only carry ASCII; fall back to an encoding that can
+        encoding = "quoted-printable"
+    if encoding in ("7bit", "8bit") and any(len(line) > MAX_LINE_OCTETS for line in payload.splitlines()):
+        # Raw lines are sent as-is, so they must fit the SMTP line limit
+        encoding = "quoted-printable"
+
+    part = MIMENonMultipart("text", subtype, charset=charset)
+    if encoding == "base64":
+        part.set_payload(payload)
+        encoders.encode_base64(part)
+    elif encoding == "quoted-printable":
+        part.set_payload(payload)
+        encoders.encode_quopri(part)
+    else:
+        # 7bit/8bit carry the raw bytes; surrogateescape keeps non-UTF-8 bytes intact
+        part.set_payload(payload.decode("ascii", "surrogateescape"))
+        part["Content-Transfer-Encoding"] = encoding
+    return part
+
+
+def _binary_part(rng: random.Random, disposition: str, index: int) -> Message:
+    """Build an attachment or inline part with random content."""
+    mime_type, ext = rng.choice(ATTACHMENT_TYPES)
+    maintype, subtype = mime_type.split("/", 1)
+    size = rng.choice([0, 1, 57, 1024, rng.randint(2, 64 * 1024)])
+    filename = f"{rng.choice(FILENAME_STEMS)}-{index}.{ext}"
+
+    part = MIMEBase(maintype, subtype)
+    part.set_payload(rng.randbytes(size))
+    encoders.encode_base64(part)
+    if any(ord(c) > 0x7F for c in filename):
+        # RFC 2231 encoded filename
+        part.add_header("Content-Disposition", disposition, filename=("utf-8", "", filename))
+    else:
+        part.add_header("Content-Disposition", disposition, filename=filename)
+    return part
+
+
+def _multipart(rng: random.Random, subtype: str) -> MIMEMultipart:
+    """Build a multipart container with a boundary drawn from the seeded RNG."""
+    return MIMEMultipart(subtype, boundary=f"=_corpus_{rng.getrandbits(64):016x}")
+
+
+def _alternative(rng: random.Random) -> Message:
+    alternative = _multipart(rng, "alternative")
+    alternative.attach(_text_part(rng, "plain", repeat=rng.randint(1, 20)))
+    alternative.attach(_text_part(rng, "html", repeat=rng.randint(1, 20)))
+    return alternative
+
+
+def _related(rng: random.Random) -> Message:
+    """HTML body with inline parts referenced by Content-ID."""
+    related = _multipart(rng, "related")
+    count = rng.randint(1, 4)
+    cids = [f"part{i}.{rng.getrandbits(32):08x}@corpus" for i in range(count)]
+    html = "<html><body>" + "".join(f'<img src="cid:{cid}">' for cid in cids) + "</body></html>"
+    html_part = MIMENonMultipart("text", "html", charset="utf-8")
+    html_part.set_payload(html.encode("utf-8"))
+    encoders.encode_quopri(html_part)
+    related.attach(html_part)
+    for i, cid in enumerate(cids):
+        inline = _binary_part(rng, "inline", i)
+        inline["Content-ID"] = f"<{cid}>"
+        related.attach(inline)
+    return related
+
+
+def _build(rng: random.Random, shape: str) -> Message:
+    if shape == "plain":
+        return _text_part(rng, repeat=rng.randint(1, 200))
+
+    if shape == "html-alternative":
+        return _alternative(rng)
+
+    if shape in ("attachments", "many-attachments"):
+        count = rng.randint(1, 3) if shape == "attachments" else rng.randint(10, 50)
+        msg = _multipart(rng, "mixed")
+        msg.attach(_text_part(rng))
+        for i in range(count):
+            msg.attach(_binary_part(rng, "attachment", i))
+        return msg
+
+    if shape == "nested":
+        # mixed > [alternative > [plain, related > [html, inline...]], mixed > [plain, attachment], attachment...]
+        msg = _multipart(rng, "mixed")
+        alternative = _multipart(rng, "alternative")
+        alternative.attach(_text_part(rng))
+        alternative.attach(_related(rng))
+        msg.attach(alternative)
+        inner = _multipart(rng, "mixed")
+        inner.attach(_text_part(rng))
+        inner.attach(_binary_part(rng, "attachment", 0))
+        msg.attach(inner)
+        for i in range(rng.randint(0, 3)):
+            msg.attach(_binary_part(rng, "attachment", i + 1))
+        return msg
+
+    if shape == "inline-related":
+        return _related(rng)
+
+    if shape == "large-headers":
+        msg = _alternative(rng)
+        for i in range(rng.randint(50, 200)):
+            msg[f"X-Corpus-{i}"] = " ".join(f"token{j}" for j in range(rng.randint(1, 40)))
+        msg["References"] = " ".join(f"<{rng.getrandbits(64):016x}@corpus>" for _ in range(rng.randint(20, 100)))
+        return msg
+
+    raise ValueError(f"Unknown shape: {shape}")
+
+
+def generate_message(seed: int, index: int) -> CorpusMessage:
+    """
+    Generate a single corpus message.
+
+    Each message has its own RNG derived from (seed, index), so any message
+    can be reproduced on its own without generating the ones before it.
+    """
+    rng = random.Random(f"{seed}:{index}")
+    shape = rng.choices([s for s, _ in SHAPES], weights=[w for _, w in SHAPES])[0]
+    msg = _build(rng, shape)
+
+    subject = f"[corpus {seed}:{index}] {shape}"
+    _, sample = rng.choice(CHARSET_TEXTS)
+    if shape == "large-headers":
+        subject += " " + " ".join([sample] * 10)
+    elif rng.random() < 0.5:
+        subject += " " + sample
+    msg["Subject"] = subject if subject.isascii() else Header(subject, "utf-8")
+
+    return CorpusMessage(index=index, seed=seed, shape=shape, subject=subject, message=msg)
+
+
+def generate_corpus(seed: int, count: int) -> Iterator[CorpusMessage]:
+    """Lazily generate count messages from seed."""
+    for index in range(count):
+        yield generate_message(seed, index)
+
+
+# Fields of a read-emails entry compared across SDKs (id and receivedAt differ by design)
+COMPARED_FIELDS = ("subject", "from", "to", "text", "html", "attachments")
+
+_SUBJECT_KEY = re.compile(r"^\[corpus (\d+):(\d+)\]")
+
+
+def _normalize_text(value: Optional[str]) -> str:
+    """Normalize line endings and trailing whitespace; SDKs legitimately differ there."""
+    if not value:
+        return ""
+    lines = value.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    return "\n".join(line.rstrip() for line in lines).strip()
+
+
+def _normalize_address(value) -> str:
+    if isinstance(value, dict):
+        value = value.get("address") or value.get("email") or ""
+    value = str(value or "").strip()
+    match = re.search(r"<([^>]+)>", value)
+    return (match.group(1) if match else value).lower()
+
+
+def normalize_email(email: dict) -> dict:
+    """Reduce a read-emails entry to the fields every SDK should agree on."""
+    to = email.get("to") or []
+    if isinstance(to, str):
+        to = [to]
+    attachments = [
+        (
+            attachment.get("filename") or "",
+            (attachment.get("contentType") or "").split(";")[0].strip().lower(),
+            attachment.get("size"),
+        )
+        for attachment in email.get("attachments") or []
+    ]
+    return {
+        "subject": email.get("subject") or "",
+        "from": _normalize_address(email.get("from")),
+        "to": sorted(_normalize_address(t) for t in to),
+        "text": _normalize_text(email.get("text")),
+        "html": _normalize_text(email.get("html")),
+        "attachments": sorted(attachments, key=repr),
+    }
+
+
+def corpus_key(subject: str) -> Optional[tuple[int, int]]:
+    """Return (seed, index) from a corpus subject, or None for other emails."""
+    match = _SUBJECT_KEY.match(subject or "")
+    return (int(match.group(1)), int(match.group(2))) if match else None
+
+
+@dataclass
+class DecodeDifference:
+    """A field on which SDKs disagree for one corpus message."""
+
+    index: int
+    shape: str
+    field: str
+    values: dict[str, object]  # SDK -> normalized value
+
+    def describe(self, width: int = 80) -> str:
+        lines = [f"message {self.index} ({self.shape}) field '{self.field}':"]
+        for sdk, value in self.values.items():
+            text = repr(value)
+            if len(text) > width:
+                text = text[:width - 3] + "..."
+            lines.append(f"    {sdk:<8} {text}")
+        return "\n".join(lines)
+
+
+def diff_decoded(
+    shapes: dict[int, str],
+    results: dict[str, list[dict]],
+) -> list[DecodeDifference]:
+    """
+    Compare the normalized read-emails output of every SDK for each corpus message.
+
+    shapes maps the index of every delivered corpus message to its shape, and
+    results maps each SDK to its read-emails output. A message missing from
+    an SDK's output is reported as a difference on the "present" field.
+    """
+    by_sdk: dict[str, dict[int, dict]] = {}
+    for sdk, emails in results.items():
+        decoded = {}
+        for email in emails:
+            key = corpus_key(email.get("subject", ""))
+            if key is not None:
+                decoded[key[1]] = normalize_email(email)
+        by_sdk[sdk] = decoded
+
+    differences = []
+    for index, shape in sorted(shapes.items()):
+        present = {sdk: index in decoded for sdk, decoded in by_sdk.items()}
+        if not all(present.values()):
+            differences.append(DecodeDifference(index, shape, "present", present))
+            continue
+
+        normalized = {sdk: decoded[index] for sdk, decoded in by_sdk.items()}
+        for field in COMPARED_FIELDS:
+            values = {sdk: email[field] for sdk, email in normalized.items()}
+            if len({repr(v) for v in values.values()}) > 1:
+                differences.append(DecodeDifference(index, shape, field, values))
+    return differences
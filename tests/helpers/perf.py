@@ -0,0 +1,261 @@
+"""Performance timings - Records testhelper timings and compares them to a baseline."""
+
+import json
+import math
+import os
+import random
+from dataclasses import dataclass
+from typing import Optional
+
+# Pseudo-command under which delivery-to-decrypt latency is recorded
+DELIVERY_TO_DECRYPT = "delivery-to-decrypt"
+
+# Maximum samples kept per (SDK, command) or test when appending runs to a timing file
+MAX_SAMPLES = 500
+
+# Bootstrap settings for the p95 delta confidence interval
+BOOTSTRAP_ROUNDS = 2000
+BOOTSTRAP_SEED = 1234
+CONFIDENCE = 0.95
+
+# Minimum samples on each side before a regression can be reported
+MIN_SAMPLES = 3
+
+
+class Timings:
+    """Per-SDK, per-command timing samples in seconds, plus per-test durations."""
+
+    def __init__(
+        self,
+        commands: Optional[dict[str, dict[str, list[float]]]] = None,
+        tests: Optional[dict[str, list[float]]] = None,
+    ):
+        self.commands: dict[str, dict[str, list[float]]] = commands or {}
+        self.tests: dict[str, list[float]] = tests or {}
+
+    def record(self, sdk: str, command: str, seconds: float) -> None:
+        """Record a single timing sample."""
+        self.commands.setdefault(sdk, {}).setdefault(command, []).append(seconds)
+
+    def record_test(self, nodeid: str, seconds: float) -> None:
+        """Record the duration of a single test run."""
+        self.tests.setdefault(nodeid, []).append(seconds)
+
+    def samples(self, sdk: str, command: str) -> list[float]:
+        """Return the samples recorded for an SDK command."""
+        return self.commands.get(sdk, {}).get(command, [])
+
+    def merge(self, other: "Timings") -> None:
+        """Append all samples from another set of timings."""
+        for sdk, commands in other.commands.items():
+            for command, values in commands.items():
+                self.commands.setdefault(sdk, {}).setdefault(command, []).extend(values)
+        for nodeid, values in other.tests.items():
+            self.tests.setdefault(nodeid, []).extend(values)
+
+    def trim(self, max_samples: int = MAX_SAMPLES) -> None:
+        """Keep only the most recent samples for each SDK command and test."""
+        for commands in self.commands.values():
+            for command, values in commands.items():
+                commands[command] = values[-max_samples:]
+        for nodeid, values in self.tests.items():
+            self.tests[nodeid] = values[-max_samples:]
+
+    def __bool__(self) -> bool:
+        return bool(self.tests) or any(
+            values for commands in self.commands.values() for values in commands.values()
+        )
+
+    def to_dict(self) -> dict:
+        return {"version": 1, "commands": self.commands, "tests": self.tests}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Timings":
+        if data.get("version") != 1:
+            raise ValueError(f"Unsupported timing file version: {data.get('version')}")
+        return cls(
+            {
+                sdk: {command: [float(v) for v in values] for command, values in commands.items()}
+                for sdk, commands in data.get("commands", {}).items()
+            },
+            {nodeid: [float(v) for v in values] for nodeid, values in data.get("tests", {}).items()},
+        )
+
+
+# Timings recorded during the current pytest session
+recorder = Timings()
+
+
+def record_timing(sdk: str, command: str, seconds: float) -> None:
+    """Record a timing sample for the current session."""
+    recorder.record(sdk, command, seconds)
+
+
+def record_test_duration(nodeid: str, seconds: float) -> None:
+    """Record a test duration for the current session."""
+    recorder.record_test(nodeid, seconds)
+
+
+def load_timings(path: str) -> Timings:
+    """Load timings from a JSON file."""
+    with open(path) as f:
+        return Timings.from_dict(json.load(f))
+
+
+def save_timings(timings: Timings, path: str, append: bool = True) -> None:
+    """
+    Save timings to a JSON file.
+
+    When append is set and the file already exists, the new samples are added
+    to the stored ones so that a baseline accumulates over several runs.
+    """
+    combined = Timings()
+    if append and os.path.exists(path):
+        combined.merge(load_timings(path))
+    combined.merge(timings)
+    combined.trim()
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(combined.to_dict(), f, indent=2)
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Return the pct-th percentile of values using linear interpolation."""
+    if not values:
+        raise ValueError("percentile of empty sample")
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    low = math.floor(rank)
+    high = math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def bootstrap_delta_ci(
+    baseline: list[float],
+    current: list[float],
+    pct: float = 95,
+    rounds: int = BOOTSTRAP_ROUNDS,
+    confidence: float = CONFIDENCE,
+    seed: int = BOOTSTRAP_SEED,
+) -> tuple[float, float]:
+    """
+    Bootstrap a confidence interval for percentile(current) - percentile(baseline).
+
+    Both samples are resampled independently with replacement. The seed is
+    fixed so that the same inputs always produce the same interval.
+    """
+    rng = random.Random(seed)
+    deltas = sorted(
+        percentile(rng.choices(current, k=len(current)), pct)
+        - percentile(rng.choices(baseline, k=len(baseline)), pct)
+        for _ in range(rounds)
+    )
+    tail = (1 - confidence) / 2 * 100
+    return percentile(deltas, tail), percentile(deltas, 100 - tail)
+
+
+@dataclass
+class Comparison:
+    """p95 comparison of one SDK command against the baseline."""
+
+    sdk: str
+    command: str
+    baseline_n: int
+    current_n: int
+    baseline_p95: Optional[float]
+    current_p95: Optional[float]
+    delta_pct: Optional[float]
+    ci: Optional[tuple[float, float]]
+    status: str  # "ok", "regression", "improved", "new", "missing", "insufficient"
+
+    @property
+    def is_regression(self) -> bool:
+        return self.status == "regression"
+
+
+def compare_timings(
+    baseline: Timings,
+    current: Timings,
+    threshold_pct: float,
+    min_samples: int = MIN_SAMPLES,
+) -> list[Comparison]:
+    """
+    Compare current timings against a baseline, per SDK and command.
+
+    A command regresses when its p95 is more than threshold_pct slower than the
+    baseline p95 and the bootstrap confidence interval of the p95 delta lies
+    entirely above zero, so that a single noisy sample cannot fail the run.
+    """
+    comparisons = []
+    sdks = sorted(set(baseline.commands) | set(current.commands))
+    for sdk in sdks:
+        commands = sorted(set(baseline.commands.get(sdk, {})) | set(current.commands.get(sdk, {})))
+        for command in commands:
+            base = baseline.samples(sdk, command)
+            cur = current.samples(sdk, command)
+            base_p95 = percentile(base, 95) if base else None
+            cur_p95 = percentile(cur, 95) if cur else None
+            delta_pct = None
+            ci = None
+
+            if not cur:
+                status = "missing"
+            elif not base:
+                status = "new"
+            else:
+                delta_pct = (cur_p95 - base_p95) / base_p95 * 100 if base_p95 else 0.0
+                if len(base) < min_samples or len(cur) < min_samples:
+                    status = "insufficient"
+                else:
+                    ci = bootstrap_delta_ci(base, cur)
+                    if delta_pct > threshold_pct and ci[0] > 0:
+                        status = "regression"
+                    elif delta_pct < -threshold_pct and ci[1] < 0:
+                        status = "improved"
+                    else:
+                        status = "ok"
+
+            comparisons.append(Comparison(
+                sdk=sdk,
+                command=command,
+                baseline_n=len(base),
+                current_n=len(cur),
+                baseline_p95=base_p95,
+                current_p95=cur_p95,
+                delta_pct=delta_pct,
+                ci=ci,
+                status=status,
+            ))
+    return comparisons
+
+
+def _fmt_seconds(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value * 1000:.0f}ms"
+
+
+def format_comparison_table(comparisons: list[Comparison], threshold_pct: float) -> list[str]:
+    """Format comparisons as a diff table grouped by SDK and command."""
+    lines = [f"p95 vs baseline (regression threshold: +{threshold_pct:g}%)"]
+    header = (
+        f"  {'command':<22} {'n base':>6} {'n cur':>6} {'base p95':>10} {'cur p95':>10}"
+        f" {'delta':>8} {'95% CI of delta':>20}  status"
+    )
+    current_sdk = None
+    for c in comparisons:
+        if c.sdk != current_sdk:
+            current_sdk = c.sdk
+            lines.append("")
+            lines.append(f"{c.sdk}")
+            lines.append(header)
+        delta = "-" if c.delta_pct is None else f"{c.delta_pct:+.1f}%"
+        ci = "-" if c.ci is None else f"[{c.ci[0] * 1000:+.0f}, {c.ci[1] * 1000:+.0f}]ms"
+        status = c.status.upper() if c.is_regression else c.status
+        lines.append(
+            f"  {c.command:<22} {c.baseline_n:>6} {c.current_n:>6}"
+            f" {_fmt_seconds(c.baseline_p95):>10} {_fmt_seconds(c.current_p95):>10}"
+            f" {delta:>8} {ci:>20}  {status}"
+        )
+    return lines
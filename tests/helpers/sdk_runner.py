@@ -3,14 +3,101 @@
 import subprocess
 import json
 import os
-from dataclasses import dataclass
+import queue
+import signal
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass, replace
 from typing import Literal, Optional
 
+from .perf import DELIVERY_TO_DECRYPT, record_timing
+
 SDK = Literal["go", "node", "python", "java", "dotnet"]
 
 
+class TesthelperCommands(ABC):
+    """Testhelper commands shared by one-shot runners and long-lived helper processes."""
+
+    sdk: SDK
+
+    # Whether commands record their timings for the session perf report
+    record_timings = True
+
+    @abstractmethod
+    def run(
+        self,
+        command: str,
+        args: Optional[list[str]] = None,
+        stdin: Optional[str] = None,
+        timeout: int = 30,
+        record: bool = True,
+    ) -> dict:
+        """Run a testhelper command and return its parsed JSON result."""
+
+    def create_inbox(self) -> dict:
+        """Create a new inbox and return the export data."""
+        return self.run("create-inbox")
+
+    def import_inbox(self, export_data: dict) -> dict:
+        """Import an inbox from export data."""
+        return self.run("import-inbox", stdin=json.dumps(export_data))
+
+    def read_emails(self, export_data: dict, timeout: int = 30, record: bool = True) -> dict:
+        """Import inbox and fetch/decrypt all emails."""
+        return self.run("read-emails", stdin=json.dumps(export_data), timeout=timeout, record=record)
+
+    def wait_for_emails(
+        self,
+        export_data: dict,
+        sent_at: float,
+        min_count: int = 1,
+        timeout: float = 30,
+        poll_interval: float = 0.5,
+        read_timeout: int = 30,
+    ) -> dict:
+        """
+        Poll read-emails until at least min_count emails have been decrypted.
+
+        The time from sent_at (a time.monotonic() value taken just before the
+        email was sent) until the emails were decrypted is recorded as the
+        delivery-to-decrypt latency for this SDK. Only the read that returned
+        the emails is recorded as a read-emails sample; empty polls depend on
+        server delivery speed rather than the SDK. read_timeout bounds each
+        individual read-emails call.
+
+        Raises:
+            RuntimeError: If the emails do not arrive within the timeout
+        """
+        deadline = sent_at + timeout
+        while True:
+            read_start = time.monotonic()
+            result = self.read_emails(export_data, timeout=read_timeout, record=False)
+            if len(result.get("emails", [])) >= min_count:
+                if self.record_timings:
+                    now = time.monotonic()
+                    record_timing(self.sdk, "read-emails", now - read_start)
+                    record_timing(self.sdk, DELIVERY_TO_DECRYPT, now - sent_at)
+                return result
+            if time.monotonic() >= deadline:
+                raise RuntimeError(
+                    f"{self.sdk} read-emails returned {len(result.get('emails', []))} emails, "
+                    f"expected at least {min_count} within {timeout}s"
+                )
+            time.sleep(poll_interval)
+
+    def send_email(self, address: str) -> dict:
+        """Send a test email to the given address."""
+        return self.run("send-email", args=[address])
+
+    def cleanup(self, address: str) -> dict:
+        """Delete the inbox for the given address."""
+        return self.run("cleanup", args=[address])
+
+
 @dataclass
-class SDKRunner:
+class SDKRunner(TesthelperCommands):
     """Runner for a specific SDK's testhelper CLI."""
 
     sdk: SDK
@@ -42,6 +129,7 @@ class SDKRunner:
         args: Optional[list[str]] = None,
         stdin: Optional[str] = None,
         timeout: int = 30,
+        record: bool = True,
     ) -> dict:
         """
         Run a testhelper command and return parsed JSON output.
@@ -51,6 +139,7 @@ class SDKRunner:
             args: Additional command arguments
             stdin: Optional JSON input to pass via stdin
             timeout: Command timeout in seconds
+            record: Record the command timing for the session perf report
 
         Returns:
             Parsed JSON response from the testhelper
@@ -59,6 +148,7 @@ class SDKRunner:
             RuntimeError: If the command fails or returns non-JSON output
         """
         cmd = self._get_command(command, args)
+        start = time.monotonic()
 
         try:
             result = subprocess.run(
@@ -80,12 +170,16 @@ class SDKRunner:
                 f"stdout: {result.stdout}"
             )
 
+        elapsed = time.monotonic() - start
+
         if not result.stdout.strip():
             # Some commands may not return output (e.g., cleanup)
+            if record and self.record_timings:
+                record_timing(self.sdk, command, elapsed)
             return {"success": True}
 
         try:
-            return json.loads(result.stdout)
+            data = json.loads(result.stdout)
         except json.JSONDecodeError as e:
             raise RuntimeError(
                 f"{self.sdk} {command} returned invalid JSON:\n"
@@ -93,25 +187,174 @@ class SDKRunner:
                 f"error: {e}"
             )
 
-    def create_inbox(self) -> dict:
-        """Create a new inbox and return the export data."""
-        return self.run("create-inbox")
+        if record and self.record_timings:
+            record_timing(self.sdk, command, elapsed)
+        return data
 
-    def import_inbox(self, export_data: dict) -> dict:
-        """Import an inbox from export data."""
-        return self.run("import-inbox", stdin=json.dumps(export_data))
+    def untimed(self) -> "SDKRunner":
+        """
+        Return a copy of this runner that does not record timings.
 
-    def read_emails(self, export_data: dict) -> dict:
-        """Import inbox and fetch/decrypt all emails."""
-        return self.run("read-emails", stdin=json.dumps(export_data))
+        For workloads such as large generated corpora whose timings are not
+        comparable to the regular single-message tests.
+        """
+        runner = replace(self)
+        runner.record_timings = False
+        return runner
 
-    def send_email(self, address: str) -> dict:
-        """Send a test email to the given address."""
-        return self.run("send-email", args=[address])
+    def serve(self, startup_timeout: int = 120) -> "SDKHelperProcess":
+        """Start a long-lived testhelper process (the `serve` command)."""
+        return SDKHelperProcess(self.sdk, self._get_command("serve"), self.path, startup_timeout)
 
-    def cleanup(self, address: str) -> dict:
-        """Delete the inbox for the given address."""
-        return self.run("cleanup", args=[address])
+
+class SDKHelperProcess(TesthelperCommands):
+    """
+    Long-lived testhelper process speaking newline-delimited JSON.
+
+    Each request is one line on stdin, {"command": ..., "args": [...], "stdin": ...},
+    and each response is one line on stdout, either {"ok": true, "result": {...}}
+    or {"ok": false, "error": "..."}. The process keeps its SDK client between
+    requests, so resource usage builds up the way it does in production.
+    """
+
+    # Soak samples are kept separately from the one-shot session timings
+    record_timings = False
+
+    def __init__(self, sdk: SDK, cmd: list[str], cwd: str, startup_timeout: int = 120):
+        self.sdk = sdk
+        self.process = subprocess.Popen(
+            cmd,
+            cwd=cwd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+            env={**os.environ},
+            # Own process group, so close() also reaches children of npx / dotnet run
+            start_new_session=True,
+        )
+        self._stdout: queue.Queue[Optional[str]] = queue.Queue()
+        self._stderr: deque[str] = deque(maxlen=200)
+        threading.Thread(target=self._read_stdout, daemon=True).start()
+        threading.Thread(target=self._read_stderr, daemon=True).start()
+
+        # The helper announces readiness with a single {"ready": true} line;
+        # helpers without serve typically print usage text and exit instead
+        try:
+            ready = self._read_line("serve", startup_timeout)
+            greeting = json.loads(ready)
+        except (RuntimeError, json.JSONDecodeError) as e:
+            self.close()
+            raise RuntimeError(f"{self.sdk} serve failed to start: {e}")
+        if not isinstance(greeting, dict) or not greeting.get("ready"):
+            self.close()
+            raise RuntimeError(f"{self.sdk} serve sent unexpected greeting: {ready.strip()}")
+
+    @property
+    def pid(self) -> int:
+        return self.process.pid
+
+    def _read_stdout(self) -> None:
+        for line in self.process.stdout:
+            self._stdout.put(line)
+        self._stdout.put(None)
+
+    def _read_stderr(self) -> None:
+        for line in self.process.stderr:
+            self._stderr.append(line)
+
+    def _read_line(self, command: str, timeout: float) -> str:
+        try:
+            line = self._stdout.get(timeout=timeout)
+        except queue.Empty:
+            raise RuntimeError(f"{self.sdk} serve {command} timed out after {timeout}s")
+        if line is None:
+            raise RuntimeError(
+                f"{self.sdk} serve exited (code {self.process.poll()}):\n"
+                f"stderr: {''.join(self._stderr)}"
+            )
+        return line
+
+    def run(
+        self,
+        command: str,
+        args: Optional[list[str]] = None,
+        stdin: Optional[str] = None,
+        timeout: int = 30,
+        record: bool = True,
+    ) -> dict:
+        """
+        Send a command to the helper process and return its parsed result.
+
+        Helper process timings are never recorded (see record_timings). The
+        protocol has no request IDs, so a request that times out closes the
+        helper; its late answer would otherwise be read as the answer to the
+        next request.
+
+        Raises:
+            RuntimeError: If the helper reports an error, exits, or times out
+        """
+        request = {"command": command, "args": args or []}
+        if stdin is not None:
+            request["stdin"] = stdin
+        try:
+            if self.process.poll() is not None:
+                raise BrokenPipeError
+            self.process.stdin.write(json.dumps(request) + "\n")
+            self.process.stdin.flush()
+        except (BrokenPipeError, ValueError):
+            # ValueError: stdin was already closed by close()
+            raise RuntimeError(
+                f"{self.sdk} serve exited (code {self.process.poll()}):\n"
+                f"stderr: {''.join(self._stderr)}"
+            )
+
+        try:
+            line = self._read_line(command, timeout)
+        except RuntimeError:
+            self.close()
+            raise
+        try:
+            response = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise RuntimeError(
+                f"{self.sdk} serve {command} returned invalid JSON:\n"
+                f"stdout: {line}\n"
+                f"error: {e}"
+            )
+
+        if not response.get("ok"):
+            raise RuntimeError(f"{self.sdk} serve {command} failed: {response.get('error')}")
+        return response.get("result") or {"success": True}
+
+    def close(self, timeout: int = 10) -> None:
+        """
+        Close stdin to let the helper exit, then kill anything left in its process group.
+
+        Wrappers such as npx or dotnet run may exit before the SDK process
+        they started, so the whole group is killed rather than just the wrapper.
+        """
+        if self.process.poll() is None:
+            try:
+                self.process.stdin.close()
+            except BrokenPipeError:
+                pass
+            try:
+                self.process.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                pass
+        try:
+            os.killpg(self.process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        self.process.wait()
+
+    def __enter__(self) -> "SDKHelperProcess":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
 
 
 def get_runners() -> dict[SDK, SDKRunner]:
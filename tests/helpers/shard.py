@@ -0,0 +1,117 @@
+"""Test sharding - Deterministically splits the test matrix across CI nodes by estimated cost."""
+
+import heapq
+import statistics
+from typing import Optional
+
+from .perf import Timings
+
+# Relative cost of one testhelper call per SDK, used when no timings are available.
+# Interpreted/JIT runtimes pay a startup cost on every call (dotnet run builds first).
+DEFAULT_SDK_COST = {
+    "go": 1.0,
+    "python": 1.5,
+    "node": 2.0,
+    "java": 3.0,
+    "dotnet": 5.0,
+}
+
+# Parameters that carry an SDK name in parametrized tests
+SDK_PARAMS = ("creator_sdk", "importer_sdk")
+
+# Fixtures that give a test every configured SDK rather than one per parameter
+ALL_SDK_FIXTURES = ("runners",)
+
+# Typical number of testhelper calls per test (create, read, cleanup)
+CALLS_PER_TEST = 3
+
+# Cost of a test that runs no testhelper at all (SDK-free unit tests)
+NO_SDK_COST = 0.01
+
+
+def parse_shard(value: str) -> tuple[int, int]:
+    """
+    Parse a shard spec of the form "i/n" (1-based).
+
+    Raises:
+        ValueError: If the spec is malformed or out of range
+    """
+    try:
+        index_str, total_str = value.split("/")
+        index, total = int(index_str), int(total_str)
+    except ValueError:
+        raise ValueError(f"Invalid shard '{value}', expected i/n (e.g. 1/4)")
+    if total < 1 or not 1 <= index <= total:
+        raise ValueError(f"Invalid shard '{value}', index must be between 1 and {max(total, 1)}")
+    return index, total
+
+
+def sdk_costs(timings: Optional[Timings]) -> dict[str, float]:
+    """
+    Return the relative cost of one testhelper call per SDK.
+
+    Uses the median of all recorded command timings (in seconds) when
+    available. SDKs without samples get their DEFAULT_SDK_COST scaled to
+    seconds by the median measured/default ratio of the SDKs that have them.
+    """
+    measured: dict[str, float] = {}
+    if timings:
+        for sdk, commands in timings.commands.items():
+            samples = [v for values in commands.values() for v in values]
+            if samples:
+                measured[sdk] = statistics.median(samples)
+
+    ratios = [measured[sdk] / DEFAULT_SDK_COST[sdk] for sdk in measured if sdk in DEFAULT_SDK_COST]
+    scale = statistics.median(ratios) if ratios else 1.0
+    costs = {sdk: cost * scale for sdk, cost in DEFAULT_SDK_COST.items()}
+    costs.update(measured)
+    return costs
+
+
+def estimate_cost(
+    nodeid: str,
+    params: dict,
+    timings: Optional[Timings],
+    costs: dict[str, float],
+    fixtures: tuple[str, ...] = (),
+) -> float:
+    """
+    Estimate the wall time of a single test.
+
+    Prefers the median recorded duration of the test itself; otherwise
+    assumes CALLS_PER_TEST testhelper calls spread over the SDKs the test is
+    parametrized with. Tests using one of ALL_SDK_FIXTURES are charged
+    CALLS_PER_TEST calls on every SDK in costs, and tests that use no SDK
+    at all cost NO_SDK_COST.
+    """
+    if timings and timings.tests.get(nodeid):
+        return statistics.median(timings.tests[nodeid])
+
+    sdks = [params[name] for name in SDK_PARAMS if name in params]
+    if not sdks:
+        if any(name in fixtures for name in ALL_SDK_FIXTURES):
+            return CALLS_PER_TEST * sum(costs.values())
+        return NO_SDK_COST
+    per_call = [costs.get(sdk, max(costs.values())) for sdk in sdks]
+    return CALLS_PER_TEST * statistics.mean(per_call)
+
+
+def assign_shards(costs: dict[str, float], total: int) -> dict[str, int]:
+    """
+    Assign tests to shards, balancing the summed cost per shard.
+
+    Uses longest-processing-time-first: tests are taken in order of decreasing
+    cost (ties broken by node ID) and each goes to the currently cheapest shard
+    (ties broken by shard index). The result depends only on the inputs, so
+    every node computes the same assignment.
+
+    Returns:
+        Mapping of node ID to 1-based shard index
+    """
+    heap = [(0.0, index) for index in range(1, total + 1)]
+    assignment: dict[str, int] = {}
+    for nodeid in sorted(costs, key=lambda n: (-costs[n], n)):
+        load, index = heapq.heappop(heap)
+        assignment[nodeid] = index
+        heapq.heappush(heap, (load + costs[nodeid], index))
+    return assignment
@@ -6,7 +6,8 @@ from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
 from email import encoders
-from typing import Optional
+from email.message import Message
+from typing import Iterable, Optional
 
 
 def get_smtp_config() -> tuple[str, int]:
@@ -122,3 +123,38 @@ def send_html_email(
 
     with smtplib.SMTP(host, port) as smtp:
         smtp.send_message(msg)
+
+
+def send_messages(
+    to_address: str,
+    messages: Iterable[Message],
+    from_address: str = "test@example.com",
+) -> int:
+    """
+    Send prebuilt messages over a single SMTP connection.
+
+    From and To are set on each message that does not already have them.
+    Messages are consumed lazily, so large generated corpora are never held
+    in memory at once.
+
+    Args:
+        to_address: Recipient email address
+        messages: Messages to send
+        from_address: Sender email address
+
+    Returns:
+        Number of messages sent
+    """
+    host, port = get_smtp_config()
+    count = 0
+
+    with smtplib.SMTP(host, port) as smtp:
+        for msg in messages:
+            if "From" not in msg:
+                msg["From"] = from_address
+            if "To" not in msg:
+                msg["To"] = to_address
+            smtp.send_message(msg)
+            count += 1
+
+    return count
@@ -0,0 +1,202 @@
+"""Soak testing - Samples helper process resources over time and detects leaks and drift."""
+
+import math
+import os
+import re
+import statistics
+from dataclasses import dataclass, asdict
+from typing import Optional
+
+# Fraction of samples ignored at the start (JIT warmup, caches, connection pools)
+WARMUP_FRACTION = 0.1
+
+# Fraction of the remaining samples used for the start and end windows
+WINDOW_FRACTION = 0.2
+
+# Minimum samples after warmup before trends are evaluated
+MIN_SAMPLES = 20
+
+# Samples are thinned to at most this many points before trend tests (O(n^2))
+MAX_TREND_POINTS = 1000
+
+# One-sided Mann-Kendall z-score for a significant upward trend (p < 0.01)
+TREND_Z = 2.33
+
+# Growth between the start and end windows that counts as a leak or drift
+RSS_GROWTH_PCT = 10.0
+FD_GROWTH = 5
+LATENCY_DRIFT_PCT = 20.0
+
+
+@dataclass
+class SoakSample:
+    """Resource usage of the helper process tree after one soak cycle."""
+
+    cycle: int
+    elapsed: float
+    rss_bytes: int
+    open_fds: int
+    latency: float
+    ok: bool = True
+
+
+def parse_duration(value: str) -> float:
+    """
+    Parse a duration such as "90", "90s", "30m", "4h" or "1h30m" into seconds.
+
+    Raises:
+        ValueError: If the value is not a valid duration
+    """
+    if re.fullmatch(r"\d+(\.\d+)?", value):
+        return float(value)
+    parts = re.findall(r"(\d+(?:\.\d+)?)([hms])", value)
+    if not parts or "".join(n + u for n, u in parts) != value:
+        raise ValueError(f"Invalid duration '{value}', expected e.g. 90s, 30m, 4h")
+    units = {"h": 3600, "m": 60, "s": 1}
+    return sum(float(n) * units[u] for n, u in parts)
+
+
+def proc_available() -> bool:
+    """Whether process resources can be sampled from /proc (Linux only)."""
+    return os.path.isdir("/proc/self/fd")
+
+
+def process_tree(pid: int) -> list[int]:
+    """
+    Return pid and all of its descendants.
+
+    Wrappers such as npx or dotnet run start the SDK in a child process, so
+    resources have to be summed over the whole tree.
+    """
+    children: dict[int, list[int]] = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # The command name may contain spaces, so split after its closing paren
+        ppid = int(stat[stat.rindex(")") + 2:].split()[1])
+        children.setdefault(ppid, []).append(int(entry))
+
+    tree = []
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        tree.append(current)
+        pending.extend(children.get(current, []))
+    return tree
+
+
+def sample_resources(pid: int) -> tuple[int, int]:
+    """Return (RSS in bytes, open file descriptors) summed over the process tree."""
+    rss = 0
+    fds = 0
+    for tree_pid in process_tree(pid):
+        try:
+            with open(f"/proc/{tree_pid}/status") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        rss += int(line.split()[1]) * 1024
+                        break
+            fds += len(os.listdir(f"/proc/{tree_pid}/fd"))
+        except OSError:
+            # Process exited between listing and sampling
+            continue
+    return rss, fds
+
+
+def mann_kendall_z(values: list[float]) -> float:
+    """
+    Return the Mann-Kendall z-score of values.
+
+    Positive values indicate a monotonic upward trend; unlike a linear fit the
+    test is insensitive to outliers and to the shape of the growth.
+    """
+    n = len(values)
+    if n < 3:
+        return 0.0
+    s = 0
+    for i in range(n - 1):
+        for j in range(i + 1, n):
+            diff = values[j] - values[i]
+            s += (diff > 0) - (diff < 0)
+
+    ties: dict[float, int] = {}
+    for v in values:
+        ties[v] = ties.get(v, 0) + 1
+    var = (n * (n - 1) * (2 * n + 5) - sum(t * (t - 1) * (2 * t + 5) for t in ties.values())) / 18
+    if var <= 0:
+        return 0.0
+    if s > 0:
+        return (s - 1) / math.sqrt(var)
+    if s < 0:
+        return (s + 1) / math.sqrt(var)
+    return 0.0
+
+
+def _windows(values: list[float]) -> tuple[float, float]:
+    """Return the medians of the start and end windows."""
+    size = max(1, int(len(values) * WINDOW_FRACTION))
+    return statistics.median(values[:size]), statistics.median(values[-size:])
+
+
+def analyze_soak(samples: list[SoakSample]) -> list[str]:
+    """
+    Look for monotonic resource growth and latency drift.
+
+    The first WARMUP_FRACTION of samples is ignored. A metric is flagged when
+    it shows a significant upward Mann-Kendall trend and its end-window median
+    exceeds the start-window median by more than the configured margin.
+
+    Returns:
+        Human-readable findings; empty if nothing was flagged
+    """
+    steady = samples[int(len(samples) * WARMUP_FRACTION):]
+    if len(steady) < MIN_SAMPLES:
+        return []
+    if len(steady) > MAX_TREND_POINTS:
+        step = len(steady) / MAX_TREND_POINTS
+        steady = [steady[int(i * step)] for i in range(MAX_TREND_POINTS)]
+
+    findings = []
+
+    rss = [float(s.rss_bytes) for s in steady]
+    rss_z = mann_kendall_z(rss)
+    rss_start, rss_end = _windows(rss)
+    if rss_start and rss_z > TREND_Z and (rss_end - rss_start) / rss_start * 100 > RSS_GROWTH_PCT:
+        findings.append(
+            f"RSS grows monotonically: {rss_start / 2**20:.1f} MiB -> {rss_end / 2**20:.1f} MiB "
+            f"(z={rss_z:.1f})"
+        )
+
+    fds = [float(s.open_fds) for s in steady]
+    fd_z = mann_kendall_z(fds)
+    fd_start, fd_end = _windows(fds)
+    if fd_z > TREND_Z and fd_end - fd_start > FD_GROWTH:
+        findings.append(f"Open file descriptors grow monotonically: {fd_start:.0f} -> {fd_end:.0f} (z={fd_z:.1f})")
+
+    # Failed cycles end early or time out, so their latency is not comparable
+    latency = [s.latency for s in steady if s.ok]
+    latency_z = mann_kendall_z(latency)
+    lat_start, lat_end = _windows(latency) if latency else (0.0, 0.0)
+    if lat_start and latency_z > TREND_Z and (lat_end - lat_start) / lat_start * 100 > LATENCY_DRIFT_PCT:
+        findings.append(
+            f"Cycle latency drifts upward: {lat_start * 1000:.0f}ms -> {lat_end * 1000:.0f}ms "
+            f"(z={latency_z:.1f})"
+        )
+
+    return findings
+
+
+def soak_report(sdk: str, samples: list[SoakSample], findings: list[str], errors: Optional[list[str]] = None) -> dict:
+    """Build the JSON report saved for a soak run."""
+    return {
+        "sdk": sdk,
+        "cycles": len(samples),
+        "findings": findings,
+        "errors": errors or [],
+        "samples": [asdict(s) for s in samples],
+    }
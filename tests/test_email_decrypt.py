@@ -23,11 +23,10 @@ class TestEmailDecryption:
         try:
             subject = f"Plain text test - {creator_sdk.sdk}"
             body = "This is a plain text email body."
+            sent_at = time.monotonic()
             send_test_email(email_address, subject, body)
 
-            time.sleep(2)
-
-            result = creator_sdk.read_emails(export_data)
+            result = creator_sdk.wait_for_emails(export_data, sent_at)
 
             assert len(result["emails"]) >= 1
             email = result["emails"][0]
@@ -54,6 +53,7 @@ class TestEmailDecryption:
             attachment_content = b"Hello, this is attachment content!"
             attachment_name = "test.txt"
 
+            sent_at = time.monotonic()
             send_email_with_attachment(
                 email_address,
                 subject,
@@ -63,9 +63,7 @@ class TestEmailDecryption:
                 "text/plain",
             )
 
-            time.sleep(2)
-
-            result = creator_sdk.read_emails(export_data)
+            result = creator_sdk.wait_for_emails(export_data, sent_at)
 
             assert len(result["emails"]) >= 1
             email = result["emails"][0]
@@ -95,11 +93,10 @@ class TestEmailDecryption:
             html_body = "<html><body><h1>Hello</h1><p>This is HTML</p></body></html>"
             text_body = "Hello\nThis is HTML"
 
+            sent_at = time.monotonic()
             send_html_email(email_address, subject, html_body, text_body)
 
-            time.sleep(2)
-
-            result = creator_sdk.read_emails(export_data)
+            result = creator_sdk.wait_for_emails(export_data, sent_at)
 
             assert len(result["emails"]) >= 1
             email = result["emails"][0]
@@ -125,11 +122,10 @@ class TestEmailDecryption:
             subject = f"Unicode test - {creator_sdk.sdk} - 日本語"
             body = "Unicode content: 你好世界 🌍 émojis работает"
 
+            sent_at = time.monotonic()
             send_test_email(email_address, subject, body)
 
-            time.sleep(2)
-
-            result = creator_sdk.read_emails(export_data)
+            result = creator_sdk.wait_for_emails(export_data, sent_at)
 
             assert len(result["emails"]) >= 1
             email = result["emails"][0]
@@ -152,6 +148,7 @@ class TestEmailDecryption:
 
         try:
             # Send multiple emails
+            sent_at = time.monotonic()
             for i in range(3):
                 send_test_email(
                     email_address,
@@ -159,9 +156,7 @@ class TestEmailDecryption:
                     f"Body of email {i + 1}",
                 )
 
-            time.sleep(3)
-
-            result = creator_sdk.read_emails(export_data)
+            result = creator_sdk.wait_for_emails(export_data, sent_at, min_count=3)
 
             assert len(result["emails"]) >= 3, "Should have at least 3 emails"
 
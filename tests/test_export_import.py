@@ -35,13 +35,11 @@ class TestExportImport:
             # 2. Send test email
             subject = f"Interop test {creator_sdk.sdk} -> {importer_sdk.sdk}"
             body = "Test body content for interoperability test"
+            sent_at = time.monotonic()
             send_test_email(email_address, subject, body)
 
-            # 3. Wait for email processing
-            time.sleep(2)
-
-            # 4. Import and read with importer SDK
-            result = importer_sdk.read_emails(export_data)
+            # 3-4. Import and read with importer SDK, waiting for delivery
+            result = importer_sdk.wait_for_emails(export_data, sent_at)
 
             # 5. Verify email content
             assert "emails" in result, "Response should contain 'emails' key"
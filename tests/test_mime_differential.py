@@ -0,0 +1,114 @@
+"""Differential decode tests: every SDK must decode a generated MIME corpus identically."""
+
+import time
+import pytest
+
+from helpers import send_messages, send_test_email
+from helpers.mime_corpus import generate_corpus, diff_decoded
+from conftest import save_export, REFERENCE_SDK
+
+# An SDK whose corpus decode cost exceeds this many times the fastest SDK's is flagged
+SLOWDOWN_FACTOR = 5
+
+# Decode costs below this are treated as equal, so noise on a fast SDK cannot trigger the check
+MIN_DECODE_COST = 1.0
+
+# Maximum differences printed in the failure message
+MAX_REPORTED_DIFFERENCES = 20
+
+
+@pytest.mark.mime_corpus
+class TestMimeDifferential:
+    """Test that all SDKs decode the same varied MIME messages the same way."""
+
+    def test_corpus_decodes_identically(self, runners, mime_corpus_size, mime_seed, keep_inboxes):
+        """
+        Deliver a seeded MIME corpus once and compare read-emails across all SDKs.
+
+        1. Create a corpus inbox and a one-message control inbox with the reference SDK
+        2. Stream the generated corpus into the corpus inbox over a single SMTP connection
+        3. Wait until the reference SDK sees every message
+        4. Read both inboxes once with every SDK, timing each read
+        5. Compare the normalized output per message and field
+
+        Each SDK's decode cost is its corpus read time minus its control read
+        time, which removes runtime startup (e.g. dotnet run building the
+        project). The check spots an SDK that is slow on the corpus as a
+        whole; it cannot attribute the slowdown to a particular message.
+        """
+        if len(runners) < 2:
+            pytest.skip("Differential decode needs at least 2 SDKs")
+
+        # Corpus timings are not comparable to the single-message perf baseline
+        runners = {sdk: runner.untimed() for sdk, runner in runners.items()}
+        reference = runners.get(REFERENCE_SDK) or next(iter(runners.values()))
+        export_data = reference.create_inbox()
+        email_address = export_data["emailAddress"]
+        control_data = reference.create_inbox()
+        control_address = control_data["emailAddress"]
+
+        if keep_inboxes:
+            filepath = save_export(export_data, f"mime_corpus_{mime_seed}")
+            print(f"\n  Saved export: {filepath}")
+            print(f"  Email address: {email_address}")
+
+        # Large inboxes take longer to fetch and decrypt
+        read_timeout = 30 + mime_corpus_size // 5
+
+        try:
+            shapes: dict[int, str] = {}
+
+            def corpus():
+                for message in generate_corpus(mime_seed, mime_corpus_size):
+                    shapes[message.index] = message.shape
+                    yield message.message
+
+            sent_at = time.monotonic()
+            send_test_email(control_address, "Corpus control", "One-message control inbox")
+            send_messages(email_address, corpus())
+
+            reference.wait_for_emails(control_data, sent_at)
+            reference.wait_for_emails(
+                export_data,
+                sent_at,
+                min_count=mime_corpus_size,
+                timeout=60 + mime_corpus_size,
+                poll_interval=2,
+                read_timeout=read_timeout,
+            )
+
+            results: dict[str, list[dict]] = {}
+            decode_costs: dict[str, float] = {}
+            print(f"\n  Corpus seed={mime_seed} size={mime_corpus_size}")
+            for sdk, runner in runners.items():
+                start = time.monotonic()
+                runner.read_emails(control_data)
+                control_time = time.monotonic() - start
+
+                start = time.monotonic()
+                results[sdk] = runner.read_emails(export_data, timeout=read_timeout)["emails"]
+                corpus_time = time.monotonic() - start
+
+                decode_costs[sdk] = corpus_time - control_time
+                print(f"  {sdk:<8} control {control_time:.2f}s corpus {corpus_time:.2f}s "
+                      f"decode cost {decode_costs[sdk]:.2f}s")
+
+            differences = diff_decoded(shapes, results)
+            fastest = max(min(decode_costs.values()), MIN_DECODE_COST)
+            slow = [sdk for sdk, cost in decode_costs.items() if cost > SLOWDOWN_FACTOR * fastest]
+
+            report = [d.describe() for d in differences[:MAX_REPORTED_DIFFERENCES]]
+            if len(differences) > MAX_REPORTED_DIFFERENCES:
+                report.append(f"... and {len(differences) - MAX_REPORTED_DIFFERENCES} more")
+            assert not differences, (
+                f"{len(differences)} decode differences (seed={mime_seed}):\n" + "\n".join(report)
+            )
+            assert not slow, (
+                f"Pathologically slow corpus decode (> {SLOWDOWN_FACTOR}x fastest {fastest:.2f}s): "
+                + ", ".join(f"{sdk} {decode_costs[sdk]:.2f}s" for sdk in slow)
+            )
+
+        finally:
+            if not keep_inboxes:
+                reference.cleanup(email_address)
+                reference.cleanup(control_address)
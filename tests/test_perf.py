@@ -0,0 +1,78 @@
+"""Unit tests for the performance regression gate (no SDKs required)."""
+
+import pytest
+
+from helpers.perf import Timings, bootstrap_delta_ci, compare_timings, percentile
+
+BASELINE = [1.0, 1.1, 0.9, 1.05, 0.95, 1.0, 1.02, 0.98, 1.01, 0.99]
+
+
+def timings(samples: list[float], sdk: str = "go", command: str = "read-emails") -> Timings:
+    return Timings(commands={sdk: {command: list(samples)}})
+
+
+def compare(baseline: list[float], current: list[float], threshold_pct: float = 10):
+    [comparison] = compare_timings(timings(baseline), timings(current), threshold_pct)
+    return comparison
+
+
+class TestPercentile:
+    """Test the linearly interpolated percentile."""
+
+    def test_interpolates(self):
+        assert percentile([1.0, 2.0, 3.0, 4.0, 5.0], 50) == 3.0
+        assert percentile([1.0, 2.0, 3.0, 4.0, 5.0], 95) == pytest.approx(4.8)
+        assert percentile([4.0, 1.0], 50) == 2.5
+
+    def test_empty(self):
+        with pytest.raises(ValueError):
+            percentile([], 95)
+
+
+class TestBootstrap:
+    """Test the bootstrap confidence interval of the p95 delta."""
+
+    def test_seeded(self):
+        current = [v * 1.5 for v in BASELINE]
+        assert bootstrap_delta_ci(BASELINE, current) == bootstrap_delta_ci(BASELINE, current)
+
+    def test_interval_above_zero_for_slowdown(self):
+        low, high = bootstrap_delta_ci(BASELINE, [v * 1.5 for v in BASELINE])
+        assert 0 < low <= high
+
+
+class TestCompareTimings:
+    """Test the status assigned to each SDK command."""
+
+    def test_regression(self):
+        comparison = compare(BASELINE, [v * 1.5 for v in BASELINE])
+        assert comparison.status == "regression"
+        assert comparison.is_regression
+        assert comparison.delta_pct == pytest.approx(50)
+        assert comparison.ci[0] > 0
+
+    def test_improved(self):
+        comparison = compare(BASELINE, [v * 0.5 for v in BASELINE])
+        assert comparison.status == "improved"
+        assert not comparison.is_regression
+
+    def test_ok_within_threshold(self):
+        assert compare(BASELINE, [v * 1.05 for v in BASELINE]).status == "ok"
+
+    def test_single_outlier_is_not_a_regression(self):
+        # The p95 moves past the threshold but the bootstrap interval still includes zero
+        assert compare(BASELINE, BASELINE[:-1] + [5.0]).status == "ok"
+
+    def test_insufficient(self):
+        comparison = compare(BASELINE, [5.0, 5.0])
+        assert comparison.status == "insufficient"
+        assert comparison.ci is None
+        assert not comparison.is_regression
+
+    def test_new_and_missing(self):
+        comparisons = compare_timings(
+            timings(BASELINE, command="create-inbox"),
+            timings(BASELINE, command="read-emails"),
+            threshold_pct=10,
+        )
+        assert {c.command: c.status for c in comparisons} == {"create-inbox": "missing", "read-emails": "new"}
@@ -0,0 +1,91 @@
+"""Unit tests for test sharding (no SDKs required)."""
+
+import pytest
+
+from helpers.perf import Timings
+from helpers.shard import (
+    CALLS_PER_TEST,
+    DEFAULT_SDK_COST,
+    NO_SDK_COST,
+    assign_shards,
+    estimate_cost,
+    parse_shard,
+    sdk_costs,
+)
+
+
+class TestParseShard:
+    """Test parsing of --shard i/n specs."""
+
+    @pytest.mark.parametrize("value, expected", [("1/1", (1, 1)), ("1/3", (1, 3)), ("3/3", (3, 3))])
+    def test_valid(self, value, expected):
+        assert parse_shard(value) == expected
+
+    @pytest.mark.parametrize("value", ["0/3", "4/3", "a/b", "1/0", "-1/3", "3", "1/2/3", ""])
+    def test_invalid(self, value):
+        with pytest.raises(ValueError, match="Invalid shard"):
+            parse_shard(value)
+
+
+class TestAssignShards:
+    """Test that shard assignment is deterministic, complete and balanced."""
+
+    COSTS = {f"tests/test_x.py::test_{i}": float(i % 7 + 1) for i in range(40)}
+
+    def test_every_test_assigned_once(self):
+        assignment = assign_shards(self.COSTS, 4)
+        assert set(assignment) == set(self.COSTS)
+        assert set(assignment.values()) == {1, 2, 3, 4}
+
+    def test_deterministic(self):
+        reversed_costs = dict(reversed(list(self.COSTS.items())))
+        assert assign_shards(self.COSTS, 4) == assign_shards(self.COSTS, 4)
+        assert assign_shards(self.COSTS, 4) == assign_shards(reversed_costs, 4)
+
+    def test_ties_broken_by_node_id(self):
+        assignment = assign_shards({"b": 1.0, "a": 1.0, "c": 1.0}, 3)
+        assert assignment == {"a": 1, "b": 2, "c": 3}
+
+    def test_balanced(self):
+        assignment = assign_shards(self.COSTS, 4)
+        loads = [sum(c for n, c in self.COSTS.items() if assignment[n] == shard) for shard in range(1, 5)]
+        # LPT never leaves a shard more than the largest single test above the lightest one
+        assert max(loads) - min(loads) <= max(self.COSTS.values())
+
+    def test_more_shards_than_tests(self):
+        assignment = assign_shards({"a": 1.0, "b": 2.0}, 5)
+        assert sorted(assignment.values()) == [1, 2]
+
+
+class TestEstimateCost:
+    """Test the cost fallbacks used to balance shards."""
+
+    def test_prefers_recorded_test_duration(self):
+        timings = Timings(tests={"t": [4.0, 6.0, 5.0]})
+        assert estimate_cost("t", {"creator_sdk": "go"}, timings, sdk_costs(timings)) == 5.0
+
+    def test_falls_back_to_sdk_costs(self):
+        costs = {"go": 1.0, "dotnet": 3.0}
+        assert estimate_cost("t", {"creator_sdk": "go", "importer_sdk": "dotnet"}, None, costs) == CALLS_PER_TEST * 2.0
+
+    def test_unknown_sdk_costs_as_slowest(self):
+        costs = {"go": 1.0, "dotnet": 3.0}
+        assert estimate_cost("t", {"creator_sdk": "rust"}, None, costs) == CALLS_PER_TEST * 3.0
+
+    def test_sdk_free_test_is_nearly_free(self):
+        costs = {"go": 1.0, "dotnet": 3.0}
+        assert estimate_cost("t", {}, None, costs, ("request",)) == NO_SDK_COST
+
+    def test_all_sdk_fixture_costs_every_sdk(self):
+        costs = {"go": 1.0, "dotnet": 3.0}
+        assert estimate_cost("t", {}, None, costs, ("runners", "mime_seed")) == CALLS_PER_TEST * 4.0
+
+    def test_sdk_costs_defaults_without_timings(self):
+        assert sdk_costs(None) == DEFAULT_SDK_COST
+
+    def test_sdk_costs_scales_unmeasured_sdks(self):
+        # go measured at 2x its default, so unmeasured SDKs are scaled by 2 too
+        timings = Timings(commands={"go": {"create-inbox": [2.0], "read-emails": [2.0]}})
+        costs = sdk_costs(timings)
+        assert costs["go"] == 2.0
+        assert costs["dotnet"] == DEFAULT_SDK_COST["dotnet"] * 2.0
@@ -0,0 +1,105 @@
+"""Long-running soak tests against a long-lived testhelper process per SDK."""
+
+import time
+import pytest
+
+from helpers import send_test_email
+from helpers.soak import SoakSample, analyze_soak, proc_available, sample_resources, soak_report
+from conftest import save_soak_report
+
+# Consecutive failed cycles after which the soak run is aborted
+MAX_CONSECUTIVE_ERRORS = 5
+
+# Maximum errors printed in the failure message
+MAX_REPORTED_ERRORS = 10
+
+
+@pytest.mark.soak
+class TestSoak:
+    """Test that SDK clients do not leak memory or file descriptors over time."""
+
+    def test_soak_cycle(self, creator_sdk, soak_duration, soak_interval):
+        """
+        Run the create/send/read/cleanup cycle continuously for the soak duration.
+
+        After every cycle the RSS and open file descriptors of the helper's
+        process tree are sampled along with the cycle latency. The run fails
+        if any cycle fails, or if any of them grows monotonically over the
+        steady-state period.
+        """
+        if not proc_available():
+            pytest.skip("Soak sampling requires /proc (Linux)")
+
+        try:
+            helper = creator_sdk.serve()
+        except RuntimeError as e:
+            pytest.skip(f"{creator_sdk.sdk} testhelper does not support serve: {e}")
+
+        samples: list[SoakSample] = []
+        errors: list[str] = []
+        failed_cycles = 0
+        consecutive_errors = 0
+
+        with helper:
+            start = time.monotonic()
+            cycle = 0
+            while time.monotonic() - start < soak_duration:
+                cycle += 1
+                cycle_start = time.monotonic()
+                cycle_errors = len(errors)
+                email_address = None
+                try:
+                    export_data = helper.create_inbox()
+                    email_address = export_data["emailAddress"]
+
+                    subject = f"Soak test {creator_sdk.sdk} #{cycle}"
+                    sent_at = time.monotonic()
+                    send_test_email(email_address, subject, f"Soak cycle {cycle}")
+
+                    result = helper.wait_for_emails(export_data, sent_at)
+                    assert result["emails"][0]["subject"] == subject
+                except (RuntimeError, AssertionError, KeyError, OSError) as e:
+                    errors.append(f"cycle {cycle}: {e}")
+                finally:
+                    if email_address:
+                        try:
+                            helper.cleanup(email_address)
+                        except RuntimeError as e:
+                            errors.append(f"cycle {cycle} cleanup: {e}")
+
+                ok = len(errors) == cycle_errors
+                failed_cycles += not ok
+                consecutive_errors = 0 if ok else consecutive_errors + 1
+
+                if helper.process.poll() is not None:
+                    break
+
+                # Failed cycles are sampled too: intermittent errors can be a leak symptom
+                rss, fds = sample_resources(helper.pid)
+                samples.append(SoakSample(
+                    cycle=cycle,
+                    elapsed=time.monotonic() - start,
+                    rss_bytes=rss,
+                    open_fds=fds,
+                    latency=time.monotonic() - cycle_start,
+                    ok=ok,
+                ))
+
+                if consecutive_errors >= MAX_CONSECUTIVE_ERRORS:
+                    break
+
+                if soak_interval:
+                    time.sleep(soak_interval)
+
+        findings = analyze_soak(samples)
+        filepath = save_soak_report(soak_report(creator_sdk.sdk, samples, findings, errors), f"soak_{creator_sdk.sdk}")
+        print(f"\n  {creator_sdk.sdk}: {cycle} cycles, {failed_cycles} failed, report: {filepath}")
+
+        aborted = " (aborted after consecutive failures)" if consecutive_errors >= MAX_CONSECUTIVE_ERRORS else ""
+        assert not failed_cycles, (
+            f"{failed_cycles} of {cycle} cycles failed{aborted}:\n"
+            + "\n".join(errors[:MAX_REPORTED_ERRORS])
+            + (f"\n... and {len(errors) - MAX_REPORTED_ERRORS} more" if len(errors) > MAX_REPORTED_ERRORS else "")
+        )
+        assert helper.process.returncode == 0, f"{creator_sdk.sdk} helper exited with code {helper.process.returncode}"
+        assert not findings, "\n".join(findings)
@@ -0,0 +1,79 @@
+"""Unit tests for soak trend analysis (no SDKs required)."""
+
+import random
+
+import pytest
+
+from helpers.soak import SoakSample, analyze_soak, mann_kendall_z, parse_duration, TREND_Z
+
+
+def samples(count: int, rss=lambda i: 100 * 2**20, fds=lambda i: 20, latency=lambda i: 0.5, ok=lambda i: True):
+    return [
+        SoakSample(cycle=i + 1, elapsed=float(i), rss_bytes=int(rss(i)), open_fds=int(fds(i)),
+                   latency=latency(i), ok=ok(i))
+        for i in range(count)
+    ]
+
+
+class TestParseDuration:
+    """Test parsing of --soak durations."""
+
+    @pytest.mark.parametrize("value, expected", [
+        ("90", 90), ("1.5", 1.5), ("90s", 90), ("30m", 1800), ("4h", 14400), ("1h30m", 5400),
+    ])
+    def test_valid(self, value, expected):
+        assert parse_duration(value) == expected
+
+    @pytest.mark.parametrize("value", ["4x", "", "h", "1h 30m", "30m1", "-5s"])
+    def test_invalid(self, value):
+        with pytest.raises(ValueError, match="Invalid duration"):
+            parse_duration(value)
+
+
+class TestMannKendall:
+    """Test the Mann-Kendall trend statistic."""
+
+    def test_increasing(self):
+        assert mann_kendall_z([float(i) for i in range(50)]) > TREND_Z
+
+    def test_decreasing(self):
+        assert mann_kendall_z([float(-i) for i in range(50)]) < -TREND_Z
+
+    def test_constant_and_short(self):
+        assert mann_kendall_z([1.0] * 50) == 0.0
+        assert mann_kendall_z([1.0, 2.0]) == 0.0
+
+    def test_noise_is_not_a_trend(self):
+        # analyze_soak only flags upward trends
+        rng = random.Random(0)
+        assert mann_kendall_z([rng.random() for _ in range(200)]) < TREND_Z
+
+
+class TestAnalyzeSoak:
+    """Test leak and drift detection over soak samples."""
+
+    def test_flat(self):
+        rng = random.Random(0)
+        flat = samples(200, rss=lambda i: 100 * 2**20 + rng.randint(-2**20, 2**20), latency=lambda i: 0.5 + rng.random() / 10)
+        assert analyze_soak(flat) == []
+
+    def test_leaks(self):
+        leaking = samples(200, rss=lambda i: 100 * 2**20 + i * 2**20, fds=lambda i: 20 + i // 5, latency=lambda i: 0.5 + i / 100)
+        findings = analyze_soak(leaking)
+        assert len(findings) == 3
+        assert findings[0].startswith("RSS grows monotonically")
+        assert findings[1].startswith("Open file descriptors grow monotonically")
+        assert findings[2].startswith("Cycle latency drifts upward")
+
+    def test_too_few_samples(self):
+        assert analyze_soak(samples(10, rss=lambda i: 2**20 * (i + 1))) == []
+
+    def test_warmup_growth_ignored(self):
+        # RSS rises during warmup only, then stays flat
+        warmup = samples(200, rss=lambda i: min(i, 15) * 10 * 2**20 + 100 * 2**20)
+        assert analyze_soak(warmup) == []
+
+    def test_failed_cycle_latency_ignored(self):
+        # Late cycles fail fast; their short latency must not mask or fake a trend
+        failing = samples(200, latency=lambda i: 0.01 if i > 150 else 0.5, ok=lambda i: i <= 150)
+        assert analyze_soak(failing) == []